@@ -1,4 +1,5 @@
 import re
+from typing import Dict, List
 from sqlalchemy.orm import Session
 from models import Person
 from schemas import PersonCreate
@@ -12,6 +13,17 @@ def get_by_aadhaar(db: Session, aadhaar: str):
     aad = normalize_aadhaar(aadhaar)
     return db.query(Person).filter(Person.aadhaar_number == aad).first()
 
+def get_persons_by_aadhaars(db: Session, aadhaars: List[str]) -> Dict[str, Person]:
+    """
+    Fetch many persons in one IN query, keyed by the Aadhaar number as sent.
+    Numbers are matched exactly, like the single /person/by-aadhaar lookup.
+    """
+    ids = set(aadhaars)
+    if not ids:
+        return {}
+    persons = db.query(Person).filter(Person.aadhaar_number.in_(ids)).all()
+    return {p.aadhaar_number: p for p in persons}
+
 def get_by_jsp_id(db: Session, jsp_id: str):
     return db.query(Person).filter(Person.jsp_id == jsp_id).first()
 
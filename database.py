@@ -27,6 +27,7 @@ def get_db():
 import os
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 load_dotenv()
@@ -36,8 +37,15 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set")
 
+# A bare postgresql:// URL maps to psycopg 3 on newer SQLAlchemy; pin the
+# psycopg2 driver from requirements.txt (DMLGenerator.copy_bulk_insert
+# uses psycopg2's cursor.copy_expert)
+db_url = make_url(DATABASE_URL)
+if db_url.drivername == "postgresql":
+    db_url = db_url.set(drivername="postgresql+psycopg2")
+
 engine = create_engine(
-    DATABASE_URL,
+    db_url,
     pool_pre_ping=True
 )
 
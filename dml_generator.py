@@ -4,21 +4,202 @@ Generates Data Manipulation Language (INSERT, UPDATE, DELETE, SELECT) operations
 for the janasena.person table in the Aadhaar application.
 """
 
+import io
 from datetime import date, datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Callable, Dict, Final, List, Optional, Any, Tuple
 from models import Person
-from database import SessionLocal, engine
+from database import engine
+
+# A parameterized statement: SQL text with %(name)s placeholders and its bind values.
+Statement = Tuple[str, Dict[str, Any]]
+
+_SCHEMA: Final[str] = "janasena"
+_TABLE: Final[str] = "person"
+_SCHEMA_TABLE: Final[str] = f"{_SCHEMA}.{_TABLE}"
+_COLUMNS: Final[Tuple[str, ...]] = tuple(column.name for column in Person.__table__.columns)
+_COLUMN_SET: Final[frozenset] = frozenset(_COLUMNS)
+
+# Static statements; only the bind values change between calls.
+_SELECT_ALL: Final[str] = f"SELECT * FROM {_SCHEMA_TABLE};"
+_SELECT_BY_ID: Final[str] = f"""SELECT * FROM {_SCHEMA_TABLE}
+WHERE person_id = %(person_id)s;"""
+_SELECT_BY_AADHAAR: Final[str] = f"""SELECT * FROM {_SCHEMA_TABLE}
+WHERE aadhaar_number = %(aadhaar_number)s;"""
+_SELECT_BY_MOBILE: Final[str] = f"""SELECT * FROM {_SCHEMA_TABLE}
+WHERE mobile_number = %(mobile_number)s;"""
+_SELECT_BY_CONSTITUENCY: Final[str] = f"""SELECT * FROM {_SCHEMA_TABLE}
+WHERE constituency = %(constituency)s;"""
+_SELECT_BY_MANDAL: Final[str] = f"""SELECT * FROM {_SCHEMA_TABLE}
+WHERE mandal = %(mandal)s;"""
+_DELETE_BY_ID: Final[str] = f"""DELETE FROM {_SCHEMA_TABLE}
+WHERE person_id = %(person_id)s;"""
+_DELETE_BY_AADHAAR: Final[str] = f"""DELETE FROM {_SCHEMA_TABLE}
+WHERE aadhaar_number = %(aadhaar_number)s;"""
+_COUNT_ALL: Final[str] = f"SELECT COUNT(*) as total_records FROM {_SCHEMA_TABLE};"
+_COUNT_BY_CONSTITUENCY: Final[str] = f"""SELECT COUNT(*) as total_records FROM {_SCHEMA_TABLE}
+WHERE constituency = %(constituency)s;"""
+
+
+def _check_columns(columns) -> None:
+    """Reject column names that are not part of the Person table."""
+    unknown = [column for column in columns if column not in _COLUMN_SET]
+    if unknown:
+        raise ValueError(f"Unknown column(s) for {_SCHEMA_TABLE}: {', '.join(unknown)}")
+
+
+@lru_cache(maxsize=128)
+def _build_filter_sql(keys: Tuple[Tuple[str, bool], ...]) -> str:
+    """
+    Build the SELECT text for a filter shape.
+
+    Args:
+        keys: (column, is_null) pairs in filter order
+
+    Returns:
+        SQL SELECT statement with %(column)s placeholders
+    """
+    _check_columns(key for key, _ in keys)
+    where_str = " AND ".join(
+        f"{key} IS NULL" if is_null else f"{key} = %({key})s" for key, is_null in keys
+    )
+    return f"""SELECT * FROM {_SCHEMA_TABLE}
+WHERE {where_str};"""
+
+
+def _fmt_str(value: Any) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _fmt_date(value: Any) -> str:
+    return "'" + value.isoformat() + "'"
+
+
+# Literal formatter per exact value type; looked up with type(value).
+_FORMATTERS: Final[Dict[type, Callable[[Any], str]]] = {
+    str: _fmt_str,
+    bool: lambda value: "TRUE" if value else "FALSE",
+    int: str,
+    float: str,
+    date: _fmt_date,
+    datetime: _fmt_date,
+    type(None): lambda value: "NULL",
+}
+
+
+def _default_fmt(value: Any) -> str:
+    """Format subclasses via their nearest registered base, anything else as a string."""
+    for base in type(value).__mro__[1:]:
+        formatter = _FORMATTERS.get(base)
+        if formatter is not None:
+            return formatter(value)
+    return _fmt_str(value)
+
+
+def _format_value(value: Any) -> str:
+    """
+    Render a Python value as a SQL literal.
+
+    Only used to produce human-readable SQL (see render() and
+    generate_bulk_insert_script()); statements sent to the database
+    always go through bind parameters.
+    """
+    return _FORMATTERS.get(type(value), _default_fmt)(value)
+
+
+@lru_cache(maxsize=32)
+def _row_formatter(columns: Tuple[str, ...]) -> Callable[[Dict[str, Any]], str]:
+    """
+    Generate a function that renders one record as a "(v1, v2, ...)" literal row.
+
+    The source is specialized for the given column tuple: each column gets
+    the formatter for its declared Python type, guarded by a cheap
+    type(...) is check, so the common case skips the generic dispatch.
+    Values of any other type go through _format_value().
+
+    Args:
+        columns: Column names, already validated against the Person table
+
+    Returns:
+        Compiled row formatter
+    """
+    table_columns = Person.__table__.columns
+    namespace: Dict[str, Any] = {"_format_value": _format_value}
+    body = []
+    parts = []
+    for i, column in enumerate(columns):
+        body.append(f"    v{i} = r.get({column!r})")
+        try:
+            python_type = table_columns[column].type.python_type
+        except NotImplementedError:
+            python_type = None
+        formatter = _FORMATTERS.get(python_type)
+        if formatter is None:
+            parts.append(f"_format_value(v{i})")
+        else:
+            namespace[f"_t{i}"] = python_type
+            namespace[f"_f{i}"] = formatter
+            parts.append(
+                f"('NULL' if v{i} is None else _f{i}(v{i}) if type(v{i}) is _t{i} else _format_value(v{i}))"
+            )
+    source = (
+        "def _format_row(r):\n"
+        + "\n".join(body)
+        + "\n    return '(' + " + " + ', ' + ".join(parts) + " + ')'\n"
+    )
+    exec(compile(source, f"<row formatter {', '.join(columns)}>", "exec"), namespace)
+    return namespace["_format_row"]
+
+
+def _copy_field(value: Any) -> str:
+    """
+    Render a value as a COPY ... CSV field.
+
+    NULL is the unquoted empty field; everything else is quoted so that
+    empty strings survive as '' instead of turning into NULL.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
 
 
 class DMLGenerator:
     """Generate DML operations for the Person table."""
 
     def __init__(self):
-        self.schema = "janasena"
-        self.table = "person"
-        self.session = SessionLocal()
+        self.schema = _SCHEMA
+        self.table = _TABLE
+        self._columns = _COLUMNS
+        self._insert_templates: Dict[Tuple[str, ...], str] = {}
+
+    def _insert_sql(self, columns: Tuple[str, ...]) -> str:
+        """Return the (cached) parameterized INSERT text for a column tuple."""
+        sql = self._insert_templates.get(columns)
+        if sql is None:
+            _check_columns(columns)
+            columns_str = ", ".join(columns)
+            placeholders = ", ".join(f"%({column})s" for column in columns)
+            sql = f"""INSERT INTO {self.schema}.{self.table} ({columns_str})
+VALUES ({placeholders});"""
+            self._insert_templates[columns] = sql
+        return sql
 
-    def generate_insert(self, person_data: Dict[str, Any]) -> str:
+    def render(self, statement: Statement) -> str:
+        """
+        Inline the parameters of a statement into a readable SQL string.
+        
+        Args:
+            statement: (sql, params) tuple returned by one of the generate_* methods
+            
+        Returns:
+            SQL statement with literal values, for display or scripts
+        """
+        sql, params = statement
+        return sql % {key: _format_value(value) for key, value in params.items()}
+
+    def generate_insert(self, person_data: Dict[str, Any]) -> Statement:
         """
         Generate an INSERT statement for a new person record.
         
@@ -26,34 +207,36 @@ class DMLGenerator:
             person_data: Dictionary containing person information
             
         Returns:
-            SQL INSERT statement as string
+            (sql, params) tuple for a parameterized INSERT
         """
-        columns = list(person_data.keys())
-        values = list(person_data.values())
+        return self._insert_sql(tuple(person_data)), dict(person_data)
+
+    def generate_bulk_insert(self, records: List[Dict[str, Any]]) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Generate a parameterized INSERT to be executed once per record.
         
-        # Format values
-        formatted_values = []
-        for value in values:
-            if value is None:
-                formatted_values.append("NULL")
-            elif isinstance(value, str):
-                formatted_values.append(f"'{value}'")
-            elif isinstance(value, (date, datetime)):
-                formatted_values.append(f"'{value}'")
-            elif isinstance(value, bool):
-                formatted_values.append(str(value))
-            else:
-                formatted_values.append(str(value))
+        The columns are taken from the first record; keys missing from
+        later records are bound as NULL.
         
-        columns_str = ", ".join(columns)
-        values_str = ", ".join(formatted_values)
+        Args:
+            records: List of dictionaries containing person information
+            
+        Returns:
+            (sql, params_list) tuple suitable for cursor.executemany()
+        """
+        if not records:
+            return "", []
         
-        return f"""INSERT INTO {self.schema}.{self.table} ({columns_str})
-VALUES ({values_str});"""
+        columns = tuple(records[0])
+        params_list = [{key: record.get(key) for key in columns} for record in records]
+        return self._insert_sql(columns), params_list
 
-    def generate_bulk_insert(self, records: List[Dict[str, Any]]) -> str:
+    def generate_bulk_insert_script(self, records: List[Dict[str, Any]]) -> str:
         """
-        Generate bulk INSERT statements for multiple records.
+        Generate a single multi-row INSERT with literal values.
+        
+        Meant for SQL scripts (seeding, psql); use generate_bulk_insert()
+        or executemany_insert() when talking to the database.
         
         Args:
             records: List of dictionaries containing person information
@@ -64,33 +247,80 @@ VALUES ({values_str});"""
         if not records:
             return ""
         
-        columns = list(records[0].keys())
+        columns = tuple(records[0])
+        _check_columns(columns)
         columns_str = ", ".join(columns)
-        
-        values_list = []
-        for record in records:
-            formatted_values = []
-            for key in columns:
-                value = record.get(key)
-                if value is None:
-                    formatted_values.append("NULL")
-                elif isinstance(value, str):
-                    formatted_values.append(f"'{value}'")
-                elif isinstance(value, (date, datetime)):
-                    formatted_values.append(f"'{value}'")
-                elif isinstance(value, bool):
-                    formatted_values.append(str(value))
-                else:
-                    formatted_values.append(str(value))
-            values_list.append(f"({', '.join(formatted_values)})")
-        
-        values_str = ",\n".join(values_list)
+        values_str = ",\n".join(map(_row_formatter(columns), records))
         
         return f"""INSERT INTO {self.schema}.{self.table} ({columns_str})
 VALUES
 {values_str};"""
 
-    def generate_update(self, person_id: int, updates: Dict[str, Any]) -> str:
+    def executemany_insert(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Insert multiple records in one round trip.
+        
+        SQLAlchemy batches a Core INSERT executed with a list of parameter
+        sets into multi-row VALUES statements ("insertmanyvalues") instead
+        of sending one INSERT per row.
+        
+        Args:
+            records: List of dictionaries containing person information
+            
+        Returns:
+            Number of inserted rows
+        """
+        _, params_list = self.generate_bulk_insert(records)
+        if not params_list:
+            return 0
+        
+        with engine.begin() as conn:
+            conn.execute(Person.__table__.insert(), params_list)
+        return len(params_list)
+
+    def copy_bulk_insert(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Load records with PostgreSQL COPY FROM STDIN.
+        
+        Faster than executemany_insert() for large batches (hundreds of rows
+        and up); the caller decides when to switch. Columns are taken from
+        the first record and missing keys are loaded as NULL.
+        
+        Requires the psycopg2 driver (cursor.copy_expert); database.py pins
+        bare postgresql:// URLs to postgresql+psycopg2.
+        
+        Args:
+            records: List of dictionaries containing person information
+            
+        Returns:
+            Number of copied rows
+        """
+        if not records:
+            return 0
+        
+        columns = tuple(records[0])
+        _check_columns(columns)
+        
+        buf = io.StringIO()
+        for record in records:
+            buf.write(",".join(_copy_field(record.get(key)) for key in columns))
+            buf.write("\n")
+        buf.seek(0)
+        
+        copy_sql = f"COPY {self.schema}.{self.table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+        raw = engine.raw_connection()
+        try:
+            with raw.cursor() as cur:
+                cur.copy_expert(copy_sql, buf)
+            raw.commit()
+        except Exception:
+            raw.rollback()
+            raise
+        finally:
+            raw.close()
+        return len(records)
+
+    def generate_update(self, person_id: int, updates: Dict[str, Any]) -> Statement:
         """
         Generate an UPDATE statement for a person record.
         
@@ -99,27 +329,17 @@ VALUES
             updates: Dictionary of fields and values to update
             
         Returns:
-            SQL UPDATE statement
-        """
-        set_clauses = []
-        for key, value in updates.items():
-            if value is None:
-                set_clauses.append(f"{key} = NULL")
-            elif isinstance(value, str):
-                set_clauses.append(f"{key} = '{value}'")
-            elif isinstance(value, (date, datetime)):
-                set_clauses.append(f"{key} = '{value}'")
-            elif isinstance(value, bool):
-                set_clauses.append(f"{key} = {str(value)}")
-            else:
-                set_clauses.append(f"{key} = {str(value)}")
-        
-        set_str = ", ".join(set_clauses)
+            (sql, params) tuple for a parameterized UPDATE
+        """
+        _check_columns(updates)
+        set_str = ", ".join(f"{key} = %({key})s" for key in updates)
+        params = dict(updates)
+        params["where_person_id"] = person_id
         return f"""UPDATE {self.schema}.{self.table}
 SET {set_str}
-WHERE person_id = {person_id};"""
+WHERE person_id = %(where_person_id)s;""", params
 
-    def generate_delete(self, person_id: int) -> str:
+    def generate_delete(self, person_id: int) -> Statement:
         """
         Generate a DELETE statement for a person record.
         
@@ -127,12 +347,11 @@ WHERE person_id = {person_id};"""
             person_id: ID of the person to delete
             
         Returns:
-            SQL DELETE statement
+            (sql, params) tuple for a parameterized DELETE
         """
-        return f"""DELETE FROM {self.schema}.{self.table}
-WHERE person_id = {person_id};"""
+        return _DELETE_BY_ID, {"person_id": person_id}
 
-    def generate_delete_by_aadhaar(self, aadhaar_number: str) -> str:
+    def generate_delete_by_aadhaar(self, aadhaar_number: str) -> Statement:
         """
         Generate a DELETE statement for a person by Aadhaar number.
         
@@ -140,21 +359,20 @@ WHERE person_id = {person_id};"""
             aadhaar_number: Aadhaar number of the person to delete
             
         Returns:
-            SQL DELETE statement
+            (sql, params) tuple for a parameterized DELETE
         """
-        return f"""DELETE FROM {self.schema}.{self.table}
-WHERE aadhaar_number = '{aadhaar_number}';"""
+        return _DELETE_BY_AADHAAR, {"aadhaar_number": aadhaar_number}
 
-    def generate_select_all(self) -> str:
+    def generate_select_all(self) -> Statement:
         """
         Generate a SELECT statement to retrieve all person records.
         
         Returns:
-            SQL SELECT statement
+            (sql, params) tuple for the SELECT
         """
-        return f"SELECT * FROM {self.schema}.{self.table};"
+        return _SELECT_ALL, {}
 
-    def generate_select_by_id(self, person_id: int) -> str:
+    def generate_select_by_id(self, person_id: int) -> Statement:
         """
         Generate a SELECT statement to retrieve a person by ID.
         
@@ -162,12 +380,11 @@ WHERE aadhaar_number = '{aadhaar_number}';"""
             person_id: ID of the person to select
             
         Returns:
-            SQL SELECT statement
+            (sql, params) tuple for a parameterized SELECT
         """
-        return f"""SELECT * FROM {self.schema}.{self.table}
-WHERE person_id = {person_id};"""
+        return _SELECT_BY_ID, {"person_id": person_id}
 
-    def generate_select_by_aadhaar(self, aadhaar_number: str) -> str:
+    def generate_select_by_aadhaar(self, aadhaar_number: str) -> Statement:
         """
         Generate a SELECT statement to retrieve a person by Aadhaar number.
         
@@ -175,12 +392,11 @@ WHERE person_id = {person_id};"""
             aadhaar_number: Aadhaar number of the person to select
             
         Returns:
-            SQL SELECT statement
+            (sql, params) tuple for a parameterized SELECT
         """
-        return f"""SELECT * FROM {self.schema}.{self.table}
-WHERE aadhaar_number = '{aadhaar_number}';"""
+        return _SELECT_BY_AADHAAR, {"aadhaar_number": aadhaar_number}
 
-    def generate_select_by_mobile(self, mobile_number: str) -> str:
+    def generate_select_by_mobile(self, mobile_number: str) -> Statement:
         """
         Generate a SELECT statement to retrieve a person by mobile number.
         
@@ -188,12 +404,11 @@ WHERE aadhaar_number = '{aadhaar_number}';"""
             mobile_number: Mobile number of the person to select
             
         Returns:
-            SQL SELECT statement
+            (sql, params) tuple for a parameterized SELECT
         """
-        return f"""SELECT * FROM {self.schema}.{self.table}
-WHERE mobile_number = '{mobile_number}';"""
+        return _SELECT_BY_MOBILE, {"mobile_number": mobile_number}
 
-    def generate_select_by_constituency(self, constituency: str) -> str:
+    def generate_select_by_constituency(self, constituency: str) -> Statement:
         """
         Generate a SELECT statement to retrieve all persons in a constituency.
         
@@ -201,12 +416,11 @@ WHERE mobile_number = '{mobile_number}';"""
             constituency: Constituency name
             
         Returns:
-            SQL SELECT statement
+            (sql, params) tuple for a parameterized SELECT
         """
-        return f"""SELECT * FROM {self.schema}.{self.table}
-WHERE constituency = '{constituency}';"""
+        return _SELECT_BY_CONSTITUENCY, {"constituency": constituency}
 
-    def generate_select_by_mandal(self, mandal: str) -> str:
+    def generate_select_by_mandal(self, mandal: str) -> Statement:
         """
         Generate a SELECT statement to retrieve all persons in a mandal.
         
@@ -214,12 +428,11 @@ WHERE constituency = '{constituency}';"""
             mandal: Mandal name
             
         Returns:
-            SQL SELECT statement
+            (sql, params) tuple for a parameterized SELECT
         """
-        return f"""SELECT * FROM {self.schema}.{self.table}
-WHERE mandal = '{mandal}';"""
+        return _SELECT_BY_MANDAL, {"mandal": mandal}
 
-    def generate_select_with_filters(self, filters: Dict[str, Any]) -> str:
+    def generate_select_with_filters(self, filters: Dict[str, Any]) -> Statement:
         """
         Generate a SELECT statement with multiple WHERE conditions.
         
@@ -227,31 +440,22 @@ WHERE mandal = '{mandal}';"""
             filters: Dictionary of field names and values to filter by
             
         Returns:
-            SQL SELECT statement
-        """
-        where_clauses = []
-        for key, value in filters.items():
-            if value is None:
-                where_clauses.append(f"{key} IS NULL")
-            elif isinstance(value, str):
-                where_clauses.append(f"{key} = '{value}'")
-            else:
-                where_clauses.append(f"{key} = {value}")
-        
-        where_str = " AND ".join(where_clauses)
-        return f"""SELECT * FROM {self.schema}.{self.table}
-WHERE {where_str};"""
+            (sql, params) tuple for a parameterized SELECT
+        """
+        keys = tuple((key, value is None) for key, value in filters.items())
+        params = {key: value for key, value in filters.items() if value is not None}
+        return _build_filter_sql(keys), params
 
-    def generate_count_all(self) -> str:
+    def generate_count_all(self) -> Statement:
         """
         Generate a SELECT COUNT statement to count all person records.
         
         Returns:
-            SQL COUNT statement
+            (sql, params) tuple for the COUNT
         """
-        return f"SELECT COUNT(*) as total_records FROM {self.schema}.{self.table};"
+        return _COUNT_ALL, {}
 
-    def generate_count_by_constituency(self, constituency: str) -> str:
+    def generate_count_by_constituency(self, constituency: str) -> Statement:
         """
         Generate a SELECT COUNT statement for a specific constituency.
         
@@ -259,14 +463,9 @@ WHERE {where_str};"""
             constituency: Constituency name
             
         Returns:
-            SQL COUNT statement
+            (sql, params) tuple for a parameterized COUNT
         """
-        return f"""SELECT COUNT(*) as total_records FROM {self.schema}.{self.table}
-WHERE constituency = '{constituency}';"""
-
-    def close(self):
-        """Close the database session."""
-        self.session.close()
+        return _COUNT_BY_CONSTITUENCY, {"constituency": constituency}
 
 
 def example_usage():
@@ -302,7 +501,7 @@ def example_usage():
     print("=" * 80)
     print("INSERT EXAMPLE")
     print("=" * 80)
-    print(generator.generate_insert(person_data))
+    print(generator.render(generator.generate_insert(person_data)))
     print()
     
     # Example 2: Update a record
@@ -314,28 +513,28 @@ def example_usage():
         "mobile_number": "9876543211",
         "profession": "Doctor"
     }
-    print(generator.generate_update(1, updates))
+    print(generator.render(generator.generate_update(1, updates)))
     print()
     
     # Example 3: Delete a record
     print("=" * 80)
     print("DELETE EXAMPLE")
     print("=" * 80)
-    print(generator.generate_delete(1))
+    print(generator.render(generator.generate_delete(1)))
     print()
     
     # Example 4: Select all
     print("=" * 80)
     print("SELECT ALL EXAMPLE")
     print("=" * 80)
-    print(generator.generate_select_all())
+    print(generator.render(generator.generate_select_all()))
     print()
     
     # Example 5: Select by Aadhaar
     print("=" * 80)
     print("SELECT BY AADHAAR EXAMPLE")
     print("=" * 80)
-    print(generator.generate_select_by_aadhaar("123456789012"))
+    print(generator.render(generator.generate_select_by_aadhaar("123456789012")))
     print()
     
     # Example 6: Select with filters
@@ -346,14 +545,14 @@ def example_usage():
         "constituency": "Hyderabad",
         "gender": "Male"
     }
-    print(generator.generate_select_with_filters(filters))
+    print(generator.render(generator.generate_select_with_filters(filters)))
     print()
     
     # Example 7: Count all records
     print("=" * 80)
     print("COUNT ALL EXAMPLE")
     print("=" * 80)
-    print(generator.generate_count_all())
+    print(generator.render(generator.generate_count_all()))
     print()
     
     # Example 8: Bulk insert
@@ -376,10 +575,8 @@ def example_usage():
             "constituency": "Secunderabad"
         }
     ]
-    print(generator.generate_bulk_insert(records))
+    print(generator.generate_bulk_insert_script(records))
     print()
-    
-    generator.close()
 
 
 if __name__ == "__main__":
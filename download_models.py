@@ -1,5 +1,5 @@
-from paddleocr import PaddleOCR
+from ocr.engine import get_ocr
 
 print("Downloading PaddleOCR model...")
-ocr = PaddleOCR(lang="en", use_angle_cls=True, use_textline_orientation=True)
+get_ocr()
 print("Model downloaded and ready!")
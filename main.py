@@ -1,4 +1,5 @@
 import os
+from typing import Dict
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
@@ -6,11 +7,12 @@ from sqlalchemy import text
 
 from database import engine, get_db
 from models import Base, Person
-from crud import create_or_update_person
-from schemas import PersonCreate, PersonResponse
+from crud import create_or_update_person, get_persons_by_aadhaars
+from schemas import AadhaarBatchRequest, PersonCreate, PersonResponse
 
 # 🔹 OCR router (HF API based)
 from ocr.router import router as ocr_router
+from services.ocr_client import close_http_client
 
 
 # -------------------------------------------------
@@ -22,6 +24,11 @@ app = FastAPI(title="Janasena Backend API")
 app.include_router(ocr_router)
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await close_http_client()
+
+
 # -------------------------------------------------
 # DB init
 # -------------------------------------------------
@@ -72,3 +79,13 @@ def get_person_by_aadhaar(
         raise HTTPException(status_code=404, detail="Person not found")
 
     return person
+
+
+@app.post("/person/by-aadhaars", response_model=Dict[str, PersonResponse])
+def get_persons_by_aadhaar_list(
+    payload: AadhaarBatchRequest,
+    db: Session = Depends(get_db)
+):
+    # one IN (...) query instead of a request per Aadhaar number;
+    # numbers with no match are simply absent from the result
+    return get_persons_by_aadhaars(db, payload.aadhaar_numbers)
@@ -1,31 +1,73 @@
 import cv2
 import re
+import struct
+import numpy as np
 from datetime import datetime
-from paddleocr import PaddleOCR
-
-# ---------------- OCR INITIALIZATION ----------------
-ocr = PaddleOCR(
-    lang="en",
-    # keep minimal for backend stability
-)
+from ocr.engine import get_ocr
+
+# ---------------- JPEG DECODER (OPTIONAL) ----------------
+# libjpeg-turbo's SIMD decoder is faster than OpenCV's; fall back to
+# cv2.imdecode when PyTurboJPEG or the native library is missing
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _tj = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _tj = None
+
+def _jpeg_orientation(data: bytes) -> int:
+    """
+    Return the EXIF Orientation tag of a JPEG (1 = upright, also when absent).
+    Only the APP segments before the scan data are inspected.
+    """
+    pos = 2
+    while pos + 4 <= len(data) and data[pos] == 0xFF:
+        marker = data[pos + 1]
+        if marker == 0xDA:  # start of scan: no more metadata
+            break
+        size = struct.unpack(">H", data[pos + 2:pos + 4])[0]
+        segment = data[pos + 4:pos + 2 + size]
+        if marker == 0xE1 and segment[:6] == b"Exif\x00\x00":
+            tiff = segment[6:]
+            order = "<" if tiff[:2] == b"II" else ">"
+            try:
+                ifd = struct.unpack(order + "I", tiff[4:8])[0]
+                count = struct.unpack(order + "H", tiff[ifd:ifd + 2])[0]
+                for i in range(count):
+                    entry = ifd + 2 + i * 12
+                    tag, _, _, value = struct.unpack(order + "HHIH", tiff[entry:entry + 10])
+                    if tag == 0x0112:
+                        return value
+            except struct.error:
+                pass
+            return 1
+        pos += 2 + size
+    return 1
+
+def decode_image(data: bytes):
+    # TurboJPEG ignores EXIF Orientation (phone photos are often tagged 90°),
+    # while cv2.imdecode with IMREAD_COLOR applies it - so only upright JPEGs
+    # take the fast path
+    if _tj is not None and data[:2] == b"\xff\xd8" and _jpeg_orientation(data) == 1:
+        return _tj.decode(data, pixel_format=TJPF_BGR)
+    return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
 
 # ---------------- PREPROCESS IMAGE ----------------
 def preprocess_image(img_path):
-    img = cv2.imread(img_path)
-    img = cv2.resize(img, None, fx=2.5, fy=2.5, interpolation=cv2.INTER_CUBIC)
+    # read bytes ourselves: also handles non-ASCII paths, unlike imread
+    with open(img_path, "rb") as f:
+        img = decode_image(f.read())
+    # only upscale really small scans; the detector resizes to det_limit_side_len itself
+    if max(img.shape[:2]) < 600:
+        img = cv2.resize(img, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
     return img
 
 # ---------------- TEXT EXTRACTION ----------------
 def extract_text(img_path):
     img = preprocess_image(img_path)
-    result = ocr.ocr(img, cls=True)
-
-    lines = []
-    for block in result:
-        for line in block:
-            lines.append(line[1][0])
+    result = get_ocr().ocr(img, cls=True)
 
-    return "\n".join(lines)
+    # single flat pass over the blocks; PaddleOCR yields None for pages without text
+    return "\n".join(line[1][0] for block in result for line in (block or ()))
 
 # ---------------- NAME EXTRACTION ----------------
 def extract_name(text):
@@ -45,16 +87,32 @@ DATE_REGEX = re.compile(
     r'(19\d{2}|20\d{2})'
 )
 
+# ---------------- FIELD REGEXES ----------------
+_WS_RE = re.compile(r'\s+')
+_NON_DIGIT_RE = re.compile(r'\D')
+# one scan labels every candidate: near keyword / bare 12 digits / grouped 4-4-4
+_AADHAAR_UNION_RE = re.compile(
+    r'(?P<kw>(?:aadhaar|your aadhaar)[^\d]{0,20}(?P<kwnum>[2-9]\d{3}\s?\d{4}\s?\d{4}))'
+    r'|(?P<bare>\b[2-9]\d{11}\b)'
+    r'|(?P<grouped>\b[2-9]\d{3}\s\d{4}\s\d{4}\b)',
+    re.IGNORECASE
+)
+_VID_RE = re.compile(r'\d{16}')
+_MOBILE_UNION_RE = re.compile(
+    r'(?P<kw>(?:mobile|moblle|moblie)[^\d]{0,10}(?P<kwnum>[6-9]\d{9}))'
+    r'|(?P<bare>\b[6-9]\d{9}\b)',
+    re.IGNORECASE
+)
+_PIN_RE = re.compile(r'\b\d{6}\b')
+
 # ---------------- NORMALIZE OCR TEXT ----------------
 def normalize_text(text):
-    text = text.replace('\n', ' ')
-    text = re.sub(r'\s+', ' ', text)
-    return text
+    # str.split() with no args already splits on runs of any whitespace, \n included
+    return " ".join(text.split())
 
 # ---------------- DOB EXTRACTION ----------------
-def extract_dob(text):
-    text = normalize_text(text)
-    dates = DATE_REGEX.findall(text)
+def _dob_from_norm(norm):
+    dates = DATE_REGEX.findall(norm)
 
     if not dates:
         return ""
@@ -62,63 +120,62 @@ def extract_dob(text):
     # Aadhaar usually has DOB second
     return "/".join(dates[-1])
 
+def extract_dob(text):
+    return _dob_from_norm(normalize_text(text))
+
 # ---------------- GENDER ----------------
-def extract_gender(text):
-    text = text.upper()
-    if "FEMALE" in text:
+def _gender_from_upper(upper):
+    if "FEMALE" in upper:
         return "FEMALE"
-    if "MALE" in text:
+    if "MALE" in upper:
         return "MALE"
     return ""
 
+def extract_gender(text):
+    return _gender_from_upper(text.upper())
+
 # ---------------- IMPROVED AADHAAR EXTRACTION ----------------
-def extract_aadhaar_number(text):
-    clean_text = normalize_text(text)
-
-    # 1️⃣ Aadhaar near keyword (highest confidence)
-    keyword_pattern = re.compile(
-        r'(aadhaar|your aadhaar)[^\d]{0,20}((?:[2-9]\d{3}\s?\d{4}\s?\d{4}))',
-        re.IGNORECASE
-    )
-
-    match = keyword_pattern.search(clean_text)
-    if match:
-        num = re.sub(r'\s', '', match.group(2))
-        return f"{num[:4]} {num[4:8]} {num[8:]}"
-
-    # 2️⃣ General 12-digit Aadhaar (exclude VID)
-    candidates = re.findall(r'\b[2-9]\d{11}\b', clean_text)
-    for num in candidates:
-        context = clean_text[max(0, clean_text.find(num)-5): clean_text.find(num)+len(num)+5]
-        if re.search(r'\d{16}', context):
-            continue
-        return f"{num[:4]} {num[4:8]} {num[8:]}"
-
-    # 3️⃣ Grouped fallback
-    grouped = re.search(r'\b[2-9]\d{3}\s\d{4}\s\d{4}\b', clean_text)
-    if grouped:
-        return grouped.group()
+def _aadhaar_from_norm(clean_text):
+    bare = grouped = ""
+
+    for match in _AADHAAR_UNION_RE.finditer(clean_text):
+        # 1️⃣ Aadhaar near keyword (highest confidence) - nothing can beat it
+        if match.group("kw"):
+            num = _WS_RE.sub('', match.group("kwnum"))
+            return f"{num[:4]} {num[4:8]} {num[8:]}"
+
+        # 2️⃣ General 12-digit Aadhaar (exclude VID)
+        if match.group("bare"):
+            if not bare:
+                start, end = match.span()
+                if not _VID_RE.search(clean_text[max(0, start-5): end+5]):
+                    bare = match.group()
+
+        # 3️⃣ Grouped fallback
+        elif not grouped:
+            grouped = match.group()
+
+    if bare:
+        return f"{bare[:4]} {bare[4:8]} {bare[8:]}"
+    return grouped
 
-    return ""
+def extract_aadhaar_number(text):
+    return _aadhaar_from_norm(normalize_text(text))
 
 # ---------------- IMPROVED MOBILE EXTRACTION ----------------
-def extract_mobile_number(text):
-    clean_text = normalize_text(text)
-
-    keyword_match = re.search(
-        r'(mobile|moblle|moblie)[^\d]{0,10}([6-9]\d{9})',
-        clean_text,
-        re.IGNORECASE
-    )
+def _mobile_from_norm(clean_text):
+    bare = ""
 
-    if keyword_match:
-        return keyword_match.group(2)
+    for match in _MOBILE_UNION_RE.finditer(clean_text):
+        if match.group("kw"):
+            return match.group("kwnum")
+        if not bare:
+            bare = match.group()
 
-    match = re.search(r'\b[6-9]\d{9}\b', clean_text)
-    if match:
-        return match.group()
+    return bare
 
-    return ""
+def extract_mobile_number(text):
+    return _mobile_from_norm(normalize_text(text))
 
 # ---------------- FIELD EXTRACTION ----------------
 def extract_fields(text):
@@ -131,13 +188,16 @@ def extract_fields(text):
         "Pincode": ""
     }
 
+    # normalize once and share it across all field extractors
+    norm = normalize_text(text)
+
     data["Name"] = extract_name(text)
-    data["Adhaar_Number"] = extract_aadhaar_number(text)
-    data["GENDER"] = extract_gender(text)
-    data["DOB"] = extract_dob(text)
-    data["Mobile"] = extract_mobile_number(text)
+    data["Adhaar_Number"] = _aadhaar_from_norm(norm)
+    data["GENDER"] = _gender_from_upper(norm.upper())
+    data["DOB"] = _dob_from_norm(norm)
+    data["Mobile"] = _mobile_from_norm(norm)
 
-    pin_match = re.search(r'\b\d{6}\b', text)
+    pin_match = _PIN_RE.search(norm)
     if pin_match:
         data["Pincode"] = pin_match.group()
 
@@ -147,7 +207,7 @@ def extract_fields(text):
 def normalize_aadhaar(aadhaar_str: str) -> str:
     if not aadhaar_str:
         return ""
-    return re.sub(r"\D", "", aadhaar_str)
+    return _NON_DIGIT_RE.sub("", aadhaar_str)
 
 # ---------------- BACKEND SAFE ENTRY FUNCTION ----------------
 def run_aadhaar_ocr(image_path: str) -> dict:
@@ -0,0 +1,31 @@
+import os
+import threading
+
+# ---------------- SHARED OCR ENGINE ----------------
+# PaddleOCR loads several hundred MB of detection/recognition weights,
+# so build it once per process on first use and hand out the same instance.
+# paddleocr itself is only imported there too: importing this module (or
+# ocr.aadhaar_ocr) has no model-loading side effects.
+_ocr = None
+_lock = threading.Lock()
+
+
+def get_ocr():
+    global _ocr
+    if _ocr is None:
+        with _lock:
+            if _ocr is None:
+                from paddleocr import PaddleOCR
+
+                _ocr = PaddleOCR(
+                    lang="en",
+                    use_angle_cls=True,
+                    # oneDNN kernels + all cores for the CPU forward pass
+                    enable_mkldnn=True,
+                    cpu_threads=os.cpu_count() or 4,
+                    # recognise up to 16 text crops per batch
+                    rec_batch_num=16,
+                    det_limit_side_len=1280,
+                    det_db_box_thresh=0.5,
+                )
+    return _ocr
@@ -1,15 +1,70 @@
 # ocr/router.py
+import hashlib
+import threading
+from cachetools import TTLCache
 from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import AsyncIterator, Awaitable, Callable, Optional, Tuple
 from datetime import datetime
-from services.ocr_client import call_aadhaar_ocr
+from services.ocr_client import (
+    call_aadhaar_ocr_from_bytes_async,
+    call_aadhaar_ocr_from_stream_async,
+    download_image_to_bytes_async,
+)
 from crud import create_or_update_person
 from database import get_db
 from schemas import PersonCreate  # your existing pydantic schema
 
 router = APIRouter(prefix="/ocr", tags=["OCR"])
 
+# OCR results keyed by image content, so retried uploads skip the HF round trip
+_ocr_cache = TTLCache(maxsize=256, ttl=3600)
+_ocr_cache_lock = threading.Lock()
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    """
+    Yield an uploaded file from the start in chunks.
+    UploadFile.read runs in the threadpool, so large (on-disk) uploads don't block the loop.
+    """
+    await file.seek(0)
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+async def hash_upload(file: UploadFile) -> Tuple[bytes, int]:
+    """
+    Hash an uploaded file chunk by chunk; returns (content key, size in bytes).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    size = 0
+    async for chunk in iter_upload(file):
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.digest(), size
+
+
+async def cached_aadhaar_ocr(key: bytes, fetch: Callable[[], Awaitable[dict]]) -> dict:
+    """
+    Return the OCR JSON for an image, reusing the result for the same content key.
+    `fetch` is only awaited on a cache miss.
+    """
+    with _ocr_cache_lock:
+        hit = _ocr_cache.get(key)
+    if hit is not None:
+        return hit
+
+    ocr_json = await fetch()
+    with _ocr_cache_lock:
+        _ocr_cache[key] = ocr_json
+    return ocr_json
+
 
 def convert_dob_format(dob_str: str) -> Optional[str]:
     """
@@ -44,12 +99,22 @@ async def aadhaar_ocr(
     Returns the OCR JSON from the HF OCR service. If save=true, returns DB person after save.
     """
     try:
-        # 1) get bytes (prefer file if provided)
+        # 1) run OCR (prefer file if provided)
         if file is not None:
-            file_bytes = await file.read()
-            ocr_json = call_aadhaar_ocr(image_bytes=file_bytes, filename=file.filename)
+            # UploadFile.file is a SpooledTemporaryFile: hash and forward it in
+            # chunks instead of holding the whole image in memory
+            key, size = await hash_upload(file)
+            if size == 0:
+                raise HTTPException(status_code=400, detail="Uploaded file is empty")
+            ocr_json = await cached_aadhaar_ocr(key, lambda: call_aadhaar_ocr_from_stream_async(
+                iter_upload(file), size, file.filename, file.content_type
+            ))
         elif image_url:
-            ocr_json = call_aadhaar_ocr(image_url=image_url)
+            image_bytes = await download_image_to_bytes_async(image_url)
+            key = hashlib.blake2b(image_bytes, digest_size=16).digest()
+            ocr_json = await cached_aadhaar_ocr(key, lambda: call_aadhaar_ocr_from_bytes_async(
+                image_bytes, None
+            ))
         else:
             raise HTTPException(status_code=400, detail="Provide file or image_url")
 
@@ -84,7 +149,8 @@ async def aadhaar_ocr(
             }
 
         # create_or_update_person will create or update existing record
-        person = create_or_update_person(db, person_data)
+        # blocking DB work runs in the threadpool, off the event loop
+        person = await run_in_threadpool(create_or_update_person, db, person_data)
         return {"ocr_result": ocr_json, "person": person}
 
     except HTTPException:
@@ -1,12 +1,17 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import date, datetime
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 
 
 class AadhaarOCRRequest(BaseModel):
     image_url: str
 
 
+class AadhaarBatchRequest(BaseModel):
+    # capped so one request can't build an unbounded IN (...) list
+    aadhaar_numbers: List[str] = Field(..., max_length=500)
+
+
 class AadhaarOCRResponse(BaseModel):
     aadhaar_number: str
     full_name: str
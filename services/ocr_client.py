@@ -1,36 +1,76 @@
 # services/ocr_client.py
-import requests
-from typing import Optional
+import os
+import re
+import httpx
+from typing import AsyncIterator, Optional
 
 HF_OCR_URL = "https://Vazeed970-aadhaar-ocr-api.hf.space/aadhaar-ocr"
 # Increase timeout if needed
 REQUEST_TIMEOUT = 60
 
+# Shared async client: reuses the TCP/TLS connection to the HF Space and
+# keeps the FastAPI endpoints from blocking the event loop
+_http = httpx.AsyncClient(timeout=REQUEST_TIMEOUT, limits=httpx.Limits(max_connections=20))
 
-def call_aadhaar_ocr_from_bytes(file_bytes: bytes, filename: str) -> dict:
-    files = {"file": (filename or "upload.jpg", file_bytes, "image/jpeg")}
-    resp = requests.post(HF_OCR_URL, files=files, timeout=REQUEST_TIMEOUT)
+# Multipart filename escaping, copied from httpx/_multipart.py
+# (_HTML5_FORM_ENCODING_REPLACEMENTS): '"' -> %22, '\' -> '\\', and the
+# control characters 0x00-0x1F -> %XX except ESC (0x1B). Keep in sync.
+_FILENAME_REPLACEMENTS = {'"': "%22", "\\": "\\\\"}
+_FILENAME_REPLACEMENTS.update(
+    {chr(c): "%{:02X}".format(c) for c in range(0x1F + 1) if c != 0x1B}
+)
+_FILENAME_RE = re.compile("|".join(re.escape(c) for c in _FILENAME_REPLACEMENTS))
+
+
+def _check_ocr_response(resp: httpx.Response) -> dict:
     if resp.status_code != 200:
         raise RuntimeError(f"OCR service failed ({resp.status_code}): {resp.text}")
     return resp.json()
 
 
-def download_image_to_bytes(url: str) -> bytes:
-    resp = requests.get(url, timeout=REQUEST_TIMEOUT)
-    resp.raise_for_status()
-    return resp.content
+async def call_aadhaar_ocr_from_bytes_async(file_bytes: bytes, filename: str) -> dict:
+    files = {"file": (filename or "upload.jpg", file_bytes, "image/jpeg")}
+    resp = await _http.post(HF_OCR_URL, files=files)
+    return _check_ocr_response(resp)
 
 
-def call_aadhaar_ocr(image_bytes: Optional[bytes] = None, filename: Optional[str] = None, image_url: Optional[str] = None) -> dict:
+async def call_aadhaar_ocr_from_stream_async(chunks: AsyncIterator[bytes], size: int, filename: Optional[str], content_type: Optional[str] = None) -> dict:
     """
-    Convenience wrapper:
-    - if image_bytes provided => use it
-    - else if image_url provided => download and use it
-    - else raise
+    POST an image to the HF OCR service without holding it in memory.
+
+    The multipart body is built here around `chunks` (an async iterator,
+    e.g. reading an UploadFile with await file.read(n)) so no blocking file
+    read happens on the event loop; httpx would read a plain file object
+    synchronously. `size` is the image length in bytes, used for Content-Length.
     """
-    if image_bytes:
-        return call_aadhaar_ocr_from_bytes(image_bytes, filename or "upload.jpg")
-    if image_url:
-        b = download_image_to_bytes(image_url)
-        return call_aadhaar_ocr_from_bytes(b, filename or "upload.jpg")
-    raise ValueError("Provide image_bytes or image_url")
+    boundary = os.urandom(16).hex()
+    safe_name = _FILENAME_RE.sub(lambda m: _FILENAME_REPLACEMENTS[m.group(0)], filename or "upload.jpg")
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{safe_name}"\r\n'
+        f"Content-Type: {content_type or 'image/jpeg'}\r\n\r\n"
+    ).encode("utf-8")
+    tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+
+    async def body():
+        yield head
+        async for chunk in chunks:
+            yield chunk
+        yield tail
+
+    headers = {
+        "Content-Type": f"multipart/form-data; boundary={boundary}",
+        "Content-Length": str(len(head) + size + len(tail)),
+    }
+    resp = await _http.post(HF_OCR_URL, content=body(), headers=headers)
+    return _check_ocr_response(resp)
+
+
+async def download_image_to_bytes_async(url: str) -> bytes:
+    resp = await _http.get(url, follow_redirects=True)
+    resp.raise_for_status()
+    return resp.content
+
+
+async def close_http_client() -> None:
+    await _http.aclose()